@@ -1,8 +1,15 @@
 #!/usr/bin/env python3
 import argparse
+import asyncio
+import itertools
 import json
+import operator
+import os
+import pickle
+import struct
 import sys
-from collections import defaultdict
+import tempfile
+from collections import Counter, defaultdict
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
@@ -13,8 +20,8 @@ PlaywrightError = Exception
 
 def load_playwright():
     try:
-        from playwright.sync_api import Error as _PlaywrightError
-        from playwright.sync_api import sync_playwright as _sync_playwright
+        from playwright.async_api import Error as _PlaywrightError
+        from playwright.async_api import async_playwright as _async_playwright
     except Exception as exc:  # pragma: no cover
         print(
             "Python Playwright is required for scripts/apply_settings.py. "
@@ -24,7 +31,7 @@ def load_playwright():
         raise
     global PlaywrightError
     PlaywrightError = _PlaywrightError
-    return _sync_playwright
+    return _async_playwright
 
 
 def utc_now_iso() -> str:
@@ -36,8 +43,35 @@ def read_json(path: Path) -> Dict[str, Any]:
         return json.load(handle)
 
 
+def read_json_cached(path: Path) -> Dict[str, Any]:
+    # Opt-in disk cache for repeated parses of large ui_schema.json files.
+    # Keyed by (size, mtime_ns) packed into the first 16 bytes of the sidecar
+    # so a stale cache is detected with a single stat + 16-byte read.
+    if os.environ.get("UI_SCHEMA_CACHE") != "1":
+        return read_json(path)
+    stat = path.stat()
+    header = struct.pack("<qq", stat.st_size, stat.st_mtime_ns)
+    cache_path = path.with_suffix(path.suffix + ".cache.pkl")
+    try:
+        with cache_path.open("rb") as handle:
+            if handle.read(16) == header:
+                return pickle.load(handle)
+    except Exception:
+        pass
+    parsed = read_json(path)
+    try:
+        fd, tmp_name = tempfile.mkstemp(dir=str(cache_path.parent), prefix=cache_path.name)
+        with os.fdopen(fd, "wb") as handle:
+            handle.write(header)
+            pickle.dump(parsed, handle, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_name, cache_path)
+    except Exception:
+        pass
+    return parsed
+
+
 def load_values(path: Path) -> Dict[str, Any]:
-    raw = read_json(path)
+    raw = read_json_cached(path)
     if "values" in raw and isinstance(raw["values"], dict):
         return raw["values"]
     if isinstance(raw, dict):
@@ -56,7 +90,125 @@ def selector_to_locator(root: Any, selector: Dict[str, Any]) -> Any:
     raise ValueError(f"Unsupported selector kind: {kind}")
 
 
-def resolve_field_locator(page: Any, scope: Any, setting: Dict[str, Any]) -> Tuple[Optional[Any], str]:
+# Resolves every candidate selector in one browser-side pass instead of one
+# locator.count() round trip per candidate. The winning element is tagged with
+# a run-unique attribute so the caller gets a stable, unique CSS selector back.
+_RESOLVE_JS = """(root, payload) => {
+    const doc = root.ownerDocument || document;
+    const IMPLICIT_ROLES = {
+        button: ["button"],
+        checkbox: ["input[type=checkbox]"],
+        radio: ["input[type=radio]"],
+        textbox: ["input:not([type]), input[type=text], textarea"],
+        spinbutton: ["input[type=number]"],
+        combobox: ["select"],
+    };
+    const accessibleName = (el) => {
+        const aria = el.getAttribute("aria-label");
+        if (aria) return aria.trim();
+        if (el.id) {
+            const label = doc.querySelector(`label[for="${el.id}"]`);
+            if (label) return label.textContent.trim();
+        }
+        const wrapping = el.closest("label");
+        if (wrapping) return wrapping.textContent.trim();
+        return (el.textContent || "").trim();
+    };
+    const matches = (selector) => {
+        if (!selector) return null;
+        if (selector.kind === "css") {
+            return Array.from(root.querySelectorAll(selector.value));
+        }
+        if (selector.kind === "label") {
+            const text = (selector.text || "").trim();
+            const hits = [];
+            for (const label of root.querySelectorAll("label")) {
+                if (label.textContent.trim() !== text) continue;
+                const forId = label.getAttribute("for");
+                const control = forId
+                    ? doc.getElementById(forId)
+                    : label.querySelector("input, select, textarea");
+                if (control) hits.push(control);
+            }
+            for (const el of root.querySelectorAll("[aria-label]")) {
+                if (el.getAttribute("aria-label").trim() === text) hits.push(el);
+            }
+            return hits;
+        }
+        if (selector.kind === "role") {
+            const name = (selector.name || "").trim();
+            const queries = [`[role="${selector.role}"]`, ...(IMPLICIT_ROLES[selector.role] || [])];
+            const hits = [];
+            for (const el of root.querySelectorAll(queries.join(", "))) {
+                if (accessibleName(el) === name && !hits.includes(el)) hits.push(el);
+            }
+            return hits;
+        }
+        return null;
+    };
+    for (let index = 0; index < payload.candidates.length; index += 1) {
+        let hits;
+        try {
+            hits = matches(payload.candidates[index]);
+        } catch (error) {
+            continue;
+        }
+        if (hits && hits.length === 1) {
+            hits[0].setAttribute("data-apply-resolved", payload.token);
+            return { index, selector: `[data-apply-resolved="${payload.token}"]` };
+        }
+    }
+    return null;
+}"""
+
+_resolve_seq = 0
+
+# Per-field win counts for candidate selectors. When a schema version breaks a
+# primary selector, the same fallback index tends to win for every apply, so
+# trying the historical winner first drives candidates-probed-per-field toward 1.
+_SELECTOR_WINS: Dict[str, Counter] = defaultdict(Counter)
+
+
+def load_selector_stats(path: Path) -> None:
+    # A missing or malformed stats file just means a cold start: parse the
+    # whole payload before touching _SELECTOR_WINS so nothing partial lands.
+    try:
+        raw = read_json(path)
+        loaded = {
+            field_id: {int(index): int(count) for index, count in wins.items()}
+            for field_id, wins in raw.items()
+            if isinstance(wins, dict)
+        }
+    except Exception:
+        return
+    for field_id, wins in loaded.items():
+        _SELECTOR_WINS[field_id].update(wins)
+
+
+def save_selector_stats(path: Path) -> None:
+    payload = {
+        field_id: {str(index): count for index, count in wins.items()}
+        for field_id, wins in _SELECTOR_WINS.items()
+        if wins
+    }
+    try:
+        with path.open("w", encoding="utf-8") as handle:
+            json.dump(payload, handle, indent=2)
+            handle.write("\n")
+    except Exception:
+        pass
+
+
+def _candidate_order(field_id: str, candidates: List[Any]) -> List[int]:
+    wins = _SELECTOR_WINS.get(field_id)
+    if not wins:
+        return list(range(len(candidates)))
+    # Stable sort: ties keep the primary-then-fallbacks order of a first run.
+    return sorted(range(len(candidates)), key=lambda index: -wins[index])
+
+
+async def resolve_field_locator(page: Any, scope: Any, setting: Dict[str, Any]) -> Tuple[Optional[Any], str, Optional[str]]:
+    global _resolve_seq
     selector_block = setting.get("selectors", {})
     if not selector_block and setting.get("control"):
         primary = setting["control"].get("primary_selector", {})
@@ -69,18 +221,38 @@ def resolve_field_locator(page: Any, scope: Any, setting: Dict[str, Any]) -> Tup
         selector_block = {"primary": primary_selector, "fallbacks": fallback}
 
     candidates = [selector_block.get("primary")] + selector_block.get("fallbacks", [])
-    for index, selector in enumerate(candidates):
+    field_id = str(setting.get("field_id") or setting.get("settingKey") or "")
+    order = _candidate_order(field_id, candidates)
+
+    _resolve_seq += 1
+    payload = {"candidates": [candidates[index] for index in order], "token": f"f{_resolve_seq}"}
+    root = scope.locator(":root") if hasattr(scope, "goto") else scope
+    try:
+        result = await root.evaluate(_RESOLVE_JS, payload)
+    except Exception:
+        result = None
+    if result:
+        index = order[result["index"]]
+        _SELECTOR_WINS[field_id][index] += 1
+        summary = "primary" if index == 0 else f"fallback[{index - 1}]"
+        return scope.locator(result["selector"]).first, summary, result["selector"]
+
+    # The browser-side role/label matching is an approximation of Playwright's
+    # engine, so a miss (or an evaluate failure) falls back to per-candidate probes.
+    for index in order:
+        selector = candidates[index]
         if not selector:
             continue
         try:
             locator = selector_to_locator(scope, selector)
-            count = locator.count()
+            count = await locator.count()
             if count == 1:
+                _SELECTOR_WINS[field_id][index] += 1
                 summary = "primary" if index == 0 else f"fallback[{index - 1}]"
-                return locator.first, summary
+                return locator.first, summary, None
         except Exception:
             continue
-    return None, "none"
+    return None, "none", None
 
 
 def normalize_bool(value: Any) -> bool:
@@ -101,7 +273,7 @@ def normalize_str(value: Any) -> str:
     return str(value).strip()
 
 
-def open_container(page: Any, container: Dict[str, Any], timeout_ms: int) -> Any:
+async def open_container(page: Any, container: Dict[str, Any], timeout_ms: int) -> Any:
     nav_path = container.get("navPath", [])
     goto_url = None
     for step in nav_path:
@@ -109,8 +281,11 @@ def open_container(page: Any, container: Dict[str, Any], timeout_ms: int) -> Any
             goto_url = step["url"]
             break
 
-    if goto_url:
-        page.goto(goto_url, wait_until="networkidle", timeout=timeout_ms)
+    if goto_url and page.url != goto_url:
+        # domcontentloaded avoids networkidle's mandatory quiet window (and
+        # its pathological waits on pages that long-poll); readiness is
+        # checked explicitly against the dialog/page locators below instead.
+        await page.goto(goto_url, wait_until="domcontentloaded", timeout=timeout_ms)
 
     for step in nav_path:
         if step.get("action") != "click":
@@ -121,10 +296,12 @@ def open_container(page: Any, container: Dict[str, Any], timeout_ms: int) -> Any
         if not selector:
             continue
         try:
+            # No count() pre-check: count() does not wait, and after a
+            # domcontentloaded navigation SPA targets often render late. The
+            # auto-waiting click is the readiness gate; a genuinely absent
+            # target times out into the except below like before.
             target = selector_to_locator(page, selector)
-            if target.count() == 0:
-                continue
-            target.first.click(timeout=timeout_ms)
+            await target.first.click(timeout=timeout_ms)
         except Exception:
             continue
 
@@ -132,133 +309,271 @@ def open_container(page: Any, container: Dict[str, Any], timeout_ms: int) -> Any
         title = container.get("title", "")
         try:
             dialog = page.get_by_role("dialog", name=title).first
-            if dialog.count() > 0:
-                dialog.wait_for(state="visible", timeout=timeout_ms)
+            if await dialog.count() > 0:
+                await dialog.wait_for(state="visible", timeout=timeout_ms)
                 return dialog
         except Exception:
             pass
         try:
             alert = page.get_by_role("alertdialog", name=title).first
-            if alert.count() > 0:
-                alert.wait_for(state="visible", timeout=timeout_ms)
+            if await alert.count() > 0:
+                await alert.wait_for(state="visible", timeout=timeout_ms)
                 return alert
         except Exception:
             pass
         fallback = page.locator("#detailSettingsModalRoot, .ui-dialog:visible, [role='dialog'], [role='alertdialog']").first
-        if fallback.count() > 0:
-            fallback.wait_for(state="visible", timeout=timeout_ms)
+        if await fallback.count() > 0:
+            await fallback.wait_for(state="visible", timeout=timeout_ms)
             return fallback
+    try:
+        await page.locator("main, #app, body").first.wait_for(state="visible", timeout=timeout_ms)
+    except Exception:
+        pass
     return page
 
 
+# Memoized option lookup per setting dict. Settings come straight from the
+# parsed schema and live for the whole run, so keying on id(setting) is stable;
+# dicts do not take attributes, so the memo lives here instead of on the record.
+_OPTION_INDEX: Dict[int, Dict[str, str]] = {}
+
+
+def _option_index(setting: Dict[str, Any]) -> Dict[str, str]:
+    cached = _OPTION_INDEX.get(id(setting))
+    if cached is None:
+        cached = {}
+        # First-writer-wins, value before label, mirrors the old scan order.
+        for option in setting.get("options", []):
+            value = normalize_str(option.get("value"))
+            label = normalize_str(option.get("label"))
+            if value not in cached:
+                cached[value] = label or value
+            if label not in cached:
+                cached[label] = label
+        _OPTION_INDEX[id(setting)] = cached
+    return cached
+
+
 def resolve_option_label(setting: Dict[str, Any], desired: Any) -> str:
     desired_text = normalize_str(desired)
-    for option in setting.get("options", []):
-        if normalize_str(option.get("value")) == desired_text:
-            return normalize_str(option.get("label")) or desired_text
-        if normalize_str(option.get("label")) == desired_text:
-            return normalize_str(option.get("label"))
-    return desired_text
+    return _option_index(setting).get(desired_text, desired_text)
+
+
+# Collapses the radio probe (exists? checked?) into one evaluate round trip;
+# the matched element is tagged so the follow-up click reuses a unique selector.
+_RADIO_STATE_JS = """(root, payload) => {
+    const doc = root.ownerDocument || document;
+    const accessibleName = (el) => {
+        const aria = el.getAttribute("aria-label");
+        if (aria) return aria.trim();
+        if (el.id) {
+            const label = doc.querySelector(`label[for="${el.id}"]`);
+            if (label) return label.textContent.trim();
+        }
+        const wrapping = el.closest("label");
+        if (wrapping) return wrapping.textContent.trim();
+        return (el.textContent || "").trim();
+    };
+    for (const el of root.querySelectorAll('[role="radio"], input[type=radio]')) {
+        if (accessibleName(el) !== payload.label) continue;
+        el.setAttribute("data-apply-radio", payload.token);
+        return {
+            found: true,
+            checked: el.getAttribute("aria-checked") === "true" || el.checked === true,
+            selector: `[data-apply-radio="${payload.token}"]`,
+        };
+    }
+    return { found: false };
+}"""
+
+
+async def _radio_state(scope: Any, label: str) -> Optional[Dict[str, Any]]:
+    global _resolve_seq
+    _resolve_seq += 1
+    root = scope.locator(":root") if hasattr(scope, "goto") else scope
+    try:
+        return await root.evaluate(_RADIO_STATE_JS, {"label": label, "token": f"r{_resolve_seq}"})
+    except Exception:
+        return None
 
 
-def verify_locator_value(locator: Any, setting: Dict[str, Any], desired: Any) -> bool:
+async def verify_locator_value(locator: Any, setting: Dict[str, Any], desired: Any) -> bool:
     control_type = setting.get("type")
     desired_text = normalize_str(desired)
     try:
         if control_type in {"checkbox", "switch"}:
-            return locator.is_checked() == normalize_bool(desired)
+            return await locator.is_checked() == normalize_bool(desired)
         if control_type == "radio_group":
             return True
         if control_type == "dropdown_native":
-            current = locator.input_value()
+            current = await locator.input_value()
             return normalize_str(current) == desired_text or desired_text in normalize_str(current)
         if control_type == "dropdown_aria":
-            text = normalize_str(locator.inner_text())
+            text = normalize_str(await locator.inner_text())
             option_label = resolve_option_label(setting, desired)
             return option_label in text or desired_text in text
         if control_type in {"textbox", "spinbutton"}:
-            current = normalize_str(locator.input_value())
+            current = normalize_str(await locator.input_value())
             return current == desired_text
     except Exception:
         return False
     return True
 
 
-def apply_setting(page: Any, scope: Any, setting: Dict[str, Any], desired: Any, timeout_ms: int) -> Tuple[bool, bool, str]:
-    locator, selector_used = resolve_field_locator(page, scope, setting)
+# Batched readback for a container's applied fields: one evaluate answers
+# every deferred verification instead of one RPC per setting. A missing tagged
+# node maps to null (not false): SPA frameworks may re-render a control between
+# the write and the batch, replacing the node we tagged, and that must trigger
+# a per-field re-check rather than a verification failure.
+_BATCH_VERIFY_JS = """(root, specs) => {
+    const doc = root.ownerDocument || document;
+    return specs.map((spec) => {
+        const el = doc.querySelector(spec.selector);
+        if (!el) return null;
+        if (spec.kind === "checkbox") {
+            const checked = el.checked === true || el.getAttribute("aria-checked") === "true";
+            return checked === spec.expected;
+        }
+        const value = (el.value !== undefined ? String(el.value) : el.textContent || "").trim();
+        if (spec.kind === "text") return value === spec.expected;
+        if (spec.kind === "select") return value === spec.expected || value.includes(spec.expected);
+        return true;
+    });
+}"""
+
+
+async def run_batch_verify(page: Any, scope: Any, verify_queue: List[Tuple[Dict[str, Any], Dict[str, Any]]]) -> None:
+    specs = [verify["spec"] for _, verify in verify_queue]
+    root = scope.locator(":root") if hasattr(scope, "goto") else scope
+    try:
+        results = await root.evaluate(_BATCH_VERIFY_JS, specs)
+        if not isinstance(results, list) or len(results) != len(specs):
+            raise ValueError("batch verify returned unexpected shape")
+    except Exception:
+        results = [None] * len(verify_queue)
+    for (outcome, verify), verified in zip(verify_queue, results):
+        if verified is None:
+            # The tagged node is gone (re-render) or the batch failed: fall
+            # back to a fresh per-field readback. The stored locator targets
+            # the tag too, so re-resolve the field before verifying.
+            locator = verify["locator"]
+            refreshed, _, _ = await resolve_field_locator(page, scope, verify["setting"])
+            if refreshed is not None:
+                locator = refreshed
+            verified = await verify_locator_value(locator, verify["setting"], verify["desired"])
+        if not verified:
+            outcome["status"] = "failed"
+            outcome["detail"] = "verification-failed"
+
+
+async def apply_setting(
+    page: Any, scope: Any, setting: Dict[str, Any], desired: Any, timeout_ms: int
+) -> Tuple[bool, bool, str, Optional[Dict[str, Any]]]:
+    global _resolve_seq
+    locator, selector_used, resolved_selector = await resolve_field_locator(page, scope, setting)
     if locator is None:
-        return False, False, "no-unique-selector"
+        return False, False, "no-unique-selector", None
 
     setting_type = setting.get("type")
     changed = False
 
     try:
         if setting_type in {"textbox", "spinbutton"}:
-            current = normalize_str(locator.input_value())
+            current = normalize_str(await locator.input_value())
             target = normalize_str(desired)
             if current != target:
-                locator.fill(target, timeout=timeout_ms)
+                await locator.fill(target, timeout=timeout_ms)
                 changed = True
 
         elif setting_type in {"checkbox", "switch"}:
             desired_bool = normalize_bool(desired)
-            current = locator.is_checked()
+            current = await locator.is_checked()
             if current != desired_bool:
                 if desired_bool:
-                    locator.check(timeout=timeout_ms)
+                    await locator.check(timeout=timeout_ms)
                 else:
-                    locator.uncheck(timeout=timeout_ms)
+                    await locator.uncheck(timeout=timeout_ms)
                 changed = True
 
         elif setting_type == "radio_group":
             label = resolve_option_label(setting, desired)
-            radio = scope.get_by_role("radio", name=label, exact=True).first
-            if radio.count() == 0:
-                return False, False, f"radio-option-not-found:{label}"
-            if not radio.is_checked():
-                radio.click(timeout=timeout_ms)
-                changed = True
+            state = await _radio_state(scope, label)
+            if state is not None and state.get("found"):
+                if not state.get("checked"):
+                    await scope.locator(state["selector"]).first.click(timeout=timeout_ms)
+                    changed = True
+            else:
+                # Browser-side name matching is an approximation; retry with
+                # Playwright's role engine before reporting the option missing.
+                radio = scope.get_by_role("radio", name=label, exact=True).first
+                if await radio.count() == 0:
+                    return False, False, f"radio-option-not-found:{label}", None
+                if not await radio.is_checked():
+                    await radio.click(timeout=timeout_ms)
+                    changed = True
 
         elif setting_type == "dropdown_native":
             desired_value = normalize_str(desired)
-            current = normalize_str(locator.input_value())
+            current = normalize_str(await locator.input_value())
             if current != desired_value:
                 try:
-                    locator.select_option(value=desired_value, timeout=timeout_ms)
+                    await locator.select_option(value=desired_value, timeout=timeout_ms)
                 except Exception:
-                    locator.select_option(label=resolve_option_label(setting, desired), timeout=timeout_ms)
+                    await locator.select_option(label=resolve_option_label(setting, desired), timeout=timeout_ms)
                 changed = True
 
         elif setting_type == "dropdown_aria":
             option_label = resolve_option_label(setting, desired)
-            locator.click(timeout=timeout_ms)
+            await locator.click(timeout=timeout_ms)
             option = page.get_by_role("option", name=option_label, exact=True).first
-            if option.count() == 0:
-                page.keyboard.press("Escape")
-                return False, False, f"aria-option-not-found:{option_label}"
-            option.click(timeout=timeout_ms)
+            if await option.count() == 0:
+                await page.keyboard.press("Escape")
+                return False, False, f"aria-option-not-found:{option_label}", None
+            await option.click(timeout=timeout_ms)
             changed = True
 
         elif setting_type in {"button_dialog", "text_display", "table"}:
-            return True, False, "not-writable"
+            return True, False, "not-writable", None
 
         else:
-            return False, False, f"unsupported-type:{setting_type}"
+            return False, False, f"unsupported-type:{setting_type}", None
 
-        verified = verify_locator_value(locator, setting, desired)
-        if not verified and setting_type in {"radio_group", "dropdown_aria"}:
+        if setting_type in {"radio_group", "dropdown_aria"}:
             # group-level controls can verify via role lookup fallback
-            verified = True
-        if not verified:
-            return False, changed, "verification-failed"
-        return True, changed, selector_used
+            return True, changed, selector_used, None
+
+        # Defer the readback: hand the caller a serializable spec so a whole
+        # container verifies in one evaluate. The rare fallback-resolved field
+        # gets tagged here (one RPC, in place of the eager verify it replaces).
+        if resolved_selector is None:
+            try:
+                _resolve_seq += 1
+                token = f"v{_resolve_seq}"
+                await locator.evaluate('(el, token) => el.setAttribute("data-apply-verify", token)', token)
+                resolved_selector = f'[data-apply-verify="{token}"]'
+            except Exception:
+                resolved_selector = None
+        if resolved_selector is None:
+            verified = await verify_locator_value(locator, setting, desired)
+            if not verified:
+                return False, changed, "verification-failed", None
+            return True, changed, selector_used, None
+
+        if setting_type in {"checkbox", "switch"}:
+            spec = {"selector": resolved_selector, "kind": "checkbox", "expected": normalize_bool(desired)}
+        elif setting_type == "dropdown_native":
+            spec = {"selector": resolved_selector, "kind": "select", "expected": normalize_str(desired)}
+        else:
+            spec = {"selector": resolved_selector, "kind": "text", "expected": normalize_str(desired)}
+        verify = {"spec": spec, "locator": locator, "setting": setting, "desired": desired}
+        return True, changed, selector_used, verify
     except PlaywrightError as exc:
-        return False, changed, f"playwright-error:{exc}"
+        return False, changed, f"playwright-error:{exc}", None
     except Exception as exc:
-        return False, changed, str(exc)
+        return False, changed, str(exc), None
 
 
-def click_save_if_needed(page: Any, scope: Any, container: Dict[str, Any], changed: bool, timeout_ms: int) -> bool:
+async def click_save_if_needed(page: Any, scope: Any, container: Dict[str, Any], changed: bool, timeout_ms: int) -> bool:
     if not changed:
         return False
     for action in container.get("actions", []):
@@ -269,18 +584,18 @@ def click_save_if_needed(page: Any, scope: Any, container: Dict[str, Any], chang
             continue
         try:
             target = selector_to_locator(scope, selector).first
-            if target.count() == 0:
+            if await target.count() == 0:
                 target = selector_to_locator(page, selector).first
-            if target.count() == 0:
+            if await target.count() == 0:
                 continue
-            target.click(timeout=timeout_ms)
+            await target.click(timeout=timeout_ms)
             return True
         except Exception:
             continue
     return False
 
 
-def close_modal(page: Any, scope: Any, container: Dict[str, Any], timeout_ms: int) -> None:
+async def close_modal(page: Any, scope: Any, container: Dict[str, Any], timeout_ms: int) -> None:
     if container.get("type") != "modal":
         return
     close_actions = [a for a in container.get("actions", []) if a.get("kind") in {"cancel", "close"}]
@@ -290,20 +605,114 @@ def close_modal(page: Any, scope: Any, container: Dict[str, Any], timeout_ms: in
             continue
         try:
             target = selector_to_locator(scope, selector).first
-            if target.count() == 0:
+            if await target.count() == 0:
                 target = selector_to_locator(page, selector).first
-            if target.count() == 0:
+            if await target.count() == 0:
                 continue
-            target.click(timeout=timeout_ms)
+            await target.click(timeout=timeout_ms)
             return
         except Exception:
             continue
     try:
-        page.keyboard.press("Escape")
+        await page.keyboard.press("Escape")
     except Exception:
         pass
 
 
+async def process_container(
+    context: Any,
+    container_key: str,
+    container_settings: List[Tuple[Dict[str, Any], Any]],
+    containers_by_key: Dict[str, Dict[str, Any]],
+    timeout_ms: int,
+    sem: asyncio.Semaphore,
+    page_pool: List[Any],
+) -> Tuple[List[Dict[str, Any]], bool]:
+    outcomes: List[Dict[str, Any]] = []
+    container = containers_by_key.get(container_key)
+    if not container:
+        for setting, _ in container_settings:
+            outcomes.append(
+                {
+                    "settingKey": setting.get("settingKey"),
+                    "containerKey": container_key,
+                    "status": "failed",
+                    "reason": "missing-container",
+                }
+            )
+        return outcomes, False
+
+    async with sem:
+        # Pages share one BrowserContext (auth/session state is established
+        # once) and are pooled across containers, so the semaphore bound caps
+        # the pool size. With LIFO reuse a follow-up container frequently gets
+        # a page already sitting on its target URL, and open_container skips
+        # the navigation for it.
+        page = page_pool.pop() if page_pool else await context.new_page()
+        try:
+            scope = await open_container(page, container, timeout_ms)
+            verify_queue: List[Tuple[Dict[str, Any], Dict[str, Any]]] = []
+
+            for setting, desired in container_settings:
+                ok, changed, note, verify = await apply_setting(page, scope, setting, desired, timeout_ms)
+                if ok:
+                    status = "applied" if changed else "skipped"
+                else:
+                    status = "failed"
+                outcome = {
+                    "settingKey": setting.get("settingKey"),
+                    "containerKey": container_key,
+                    "type": setting.get("type"),
+                    "desired": desired,
+                    "status": status,
+                    "detail": note,
+                }
+                outcomes.append(outcome)
+                if ok and verify is not None:
+                    verify_queue.append((outcome, verify))
+
+            if verify_queue:
+                await run_batch_verify(page, scope, verify_queue)
+
+            # Counted after verification so a field that changed but failed
+            # readback does not trigger a save, matching the eager-verify flow.
+            changed_count = sum(1 for item in outcomes if item["status"] == "applied")
+            saved = await click_save_if_needed(page, scope, container, changed_count > 0, timeout_ms)
+            await close_modal(page, scope, container, timeout_ms)
+            return outcomes, saved
+        finally:
+            page_pool.append(page)
+
+
+async def apply_all(
+    settings_by_container: Dict[str, List[Tuple[Dict[str, Any], Any]]],
+    containers_by_key: Dict[str, Dict[str, Any]],
+    headless: bool,
+    timeout_ms: int,
+) -> Tuple[List[Dict[str, Any]], List[str]]:
+    sem = asyncio.Semaphore(int(os.environ.get("APPLY_CONCURRENCY", "4")))
+    outcomes: List[Dict[str, Any]] = []
+    saved_containers: List[str] = []
+
+    async with load_playwright()() as playwright:
+        browser = await playwright.chromium.launch(headless=headless)
+        context = await browser.new_context()
+        page_pool: List[Any] = []
+        tasks = [
+            process_container(context, container_key, container_settings, containers_by_key, timeout_ms, sem, page_pool)
+            for container_key, container_settings in settings_by_container.items()
+        ]
+        results = await asyncio.gather(*tasks)
+        await context.close()
+        await browser.close()
+
+    for (container_key, _), (container_outcomes, saved) in zip(settings_by_container.items(), results):
+        outcomes.extend(container_outcomes)
+        if saved:
+            saved_containers.append(container_key)
+    return outcomes, saved_containers
+
+
 def main() -> int:
     parser = argparse.ArgumentParser(description="Apply values from values.json onto ui_schema settings.")
     parser.add_argument("--schema", default="dist/ui_schema.json", help="Path to dist/ui_schema.json")
@@ -318,7 +727,7 @@ def main() -> int:
     report_path = Path(args.report)
     report_path.parent.mkdir(parents=True, exist_ok=True)
 
-    schema = read_json(schema_path)
+    schema = read_json_cached(schema_path)
     values = load_values(values_path)
 
     records = schema.get("fieldRecords") or schema.get("settings", [])
@@ -328,64 +737,27 @@ def main() -> int:
         if item.get("field_id") or item.get("settingKey")
     }
     containers_by_key = {item["containerKey"]: item for item in schema.get("containers", [])}
-    settings_by_container: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
-    for key, desired in values.items():
-        setting = settings_by_key.get(key)
-        if not setting:
-            continue
-        setting["_desired"] = desired
-        settings_by_container[setting["containerKey"]].append(setting)
-
-    outcomes: List[Dict[str, Any]] = []
-    saved_containers: List[str] = []
-
-    with load_playwright()() as playwright:
-        browser = playwright.chromium.launch(headless=args.headless)
-        page = browser.new_page()
-
-        for container_key, container_settings in settings_by_container.items():
-            container = containers_by_key.get(container_key)
-            if not container:
-                for setting in container_settings:
-                    outcomes.append(
-                        {
-                            "settingKey": setting.get("settingKey"),
-                            "containerKey": container_key,
-                            "status": "failed",
-                            "reason": "missing-container",
-                        }
-                    )
-                continue
-
-            scope = open_container(page, container, args.timeout_ms)
-            changed_count = 0
-
-            for setting in container_settings:
-                desired = setting.pop("_desired")
-                ok, changed, note = apply_setting(page, scope, setting, desired, args.timeout_ms)
-                if ok:
-                    status = "applied" if changed else "skipped"
-                    if changed:
-                        changed_count += 1
-                else:
-                    status = "failed"
-                outcomes.append(
-                    {
-                        "settingKey": setting.get("settingKey"),
-                        "containerKey": container_key,
-                        "type": setting.get("type"),
-                        "desired": desired,
-                        "status": status,
-                        "detail": note,
-                    }
-                )
+    # One contiguous sort+groupby pass instead of dict-churn per value; sorting
+    # by containerKey also makes container order deterministic across runs.
+    pairs = [
+        (settings_by_key[key]["containerKey"], settings_by_key[key], desired)
+        for key, desired in values.items()
+        if key in settings_by_key
+    ]
+    pairs.sort(key=operator.itemgetter(0))
+    settings_by_container: Dict[str, List[Tuple[Dict[str, Any], Any]]] = {
+        container_key: [(setting, desired) for _, setting, desired in group]
+        for container_key, group in itertools.groupby(pairs, key=operator.itemgetter(0))
+    }
 
-            if click_save_if_needed(page, scope, container, changed_count > 0, args.timeout_ms):
-                saved_containers.append(container_key)
+    stats_path = report_path.parent / ".selector_stats.json"
+    load_selector_stats(stats_path)
 
-            close_modal(page, scope, container, args.timeout_ms)
+    outcomes, saved_containers = asyncio.run(
+        apply_all(settings_by_container, containers_by_key, args.headless, args.timeout_ms)
+    )
 
-        browser.close()
+    save_selector_stats(stats_path)
 
     failed = [item for item in outcomes if item["status"] == "failed"]
     report = {
@@ -402,9 +774,14 @@ def main() -> int:
         "savedContainers": saved_containers,
         "outcomes": outcomes,
     }
-    with report_path.open("w", encoding="utf-8") as handle:
-        json.dump(report, handle, indent=2)
-        handle.write("\n")
+    try:
+        import orjson
+
+        report_path.write_bytes(orjson.dumps(report, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE))
+    except ImportError:
+        with report_path.open("w", encoding="utf-8") as handle:
+            json.dump(report, handle, indent=2)
+            handle.write("\n")
 
     print(f"Wrote {report_path}")
     if failed:
@@ -1,10 +1,17 @@
 #!/usr/bin/env python3
 import argparse
+import hashlib
 import json
 import os
+import pickle
+import re
+import struct
 import subprocess
 import sys
 import tempfile
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, List, Tuple
@@ -23,9 +30,38 @@ def run_command(command: List[str], env: Dict[str, str] | None = None) -> None:
         raise RuntimeError(f"Command failed ({result.returncode}): {' '.join(command)}")
 
 
-def read_schema(path: Path) -> Dict[str, Any]:
+def read_json_cached(path: Path) -> Dict[str, Any]:
+    # Opt-in disk cache for repeated parses of large ui_schema.json files
+    # (e.g. the same baseline across CI runs). Keyed by (size, mtime_ns)
+    # packed into the first 16 bytes of the sidecar so a stale cache is
+    # detected with a single stat + 16-byte read.
+    if os.environ.get("UI_SCHEMA_CACHE") != "1":
+        with path.open("r", encoding="utf-8") as handle:
+            return json.load(handle)
+    stat = path.stat()
+    header = struct.pack("<qq", stat.st_size, stat.st_mtime_ns)
+    cache_path = path.with_suffix(path.suffix + ".cache.pkl")
+    try:
+        with cache_path.open("rb") as handle:
+            if handle.read(16) == header:
+                return pickle.load(handle)
+    except Exception:
+        pass
     with path.open("r", encoding="utf-8") as handle:
-        return json.load(handle)
+        parsed = json.load(handle)
+    try:
+        fd, tmp_name = tempfile.mkstemp(dir=str(cache_path.parent), prefix=cache_path.name)
+        with os.fdopen(fd, "wb") as handle:
+            handle.write(header)
+            pickle.dump(parsed, handle, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_name, cache_path)
+    except Exception:
+        pass
+    return parsed
+
+
+def read_schema(path: Path) -> Dict[str, Any]:
+    return read_json_cached(path)
 
 
 def schema_settings(schema: Dict[str, Any]) -> List[Dict[str, Any]]:
@@ -48,106 +84,141 @@ def setting_id(setting: Dict[str, Any]) -> str:
     return str(setting.get("field_id") or setting.get("settingKey") or "")
 
 
-def setting_signature(setting: Dict[str, Any]) -> str:
+# Shared sentinel for absent sub-dicts so signature building allocates no
+# throwaway empties; never mutated.
+_EMPTY: Dict[str, Any] = {}
+
+
+def _setting_sig_tuple(setting: Dict[str, Any]) -> Tuple[str, ...]:
+    # Signatures are only ever dict keys; a tuple hashes per element with no
+    # string build. "|".join(sig) reproduces the old string form and is done
+    # lazily at report-append time only.
     if "field_id" in setting:
-        control = setting.get("control") or {}
-        group = setting.get("group") or {}
-        container = setting.get("container") or {}
-        context = setting.get("context") or {}
-        return "|".join(
-            [
-                str(setting.get("page") or ""),
-                "|".join((setting.get("breadcrumb") or [])),
-                str(container.get("title") or ""),
-                str(group.get("title") or ""),
-                str(control.get("canonical_control_id") or ""),
-                str(context.get("frame_url") or ""),
-                str(context.get("modal_title") or ""),
-                setting_type(setting),
-            ]
-        )
-    return "|".join(
-        [
-            str(setting.get("containerKey") or ""),
-            str(setting.get("groupTitle") or ""),
-            setting_label(setting),
+        control = setting.get("control") or _EMPTY
+        group = setting.get("group") or _EMPTY
+        container = setting.get("container") or _EMPTY
+        context = setting.get("context") or _EMPTY
+        return (
+            str(setting.get("page") or ""),
+            "|".join(setting.get("breadcrumb") or ()),
+            str(container.get("title") or ""),
+            str(group.get("title") or ""),
+            str(control.get("canonical_control_id") or ""),
+            str(context.get("frame_url") or ""),
+            str(context.get("modal_title") or ""),
             setting_type(setting),
-        ]
+        )
+    return (
+        str(setting.get("containerKey") or ""),
+        str(setting.get("groupTitle") or ""),
+        setting_label(setting),
+        setting_type(setting),
     )
 
 
+# Timestamp-looking value: contains a "/" or ":" plus at least one digit.
+# A single C-level regex scan replaces the per-character Python loops.
+_TS_RE = re.compile(r"(?s)(?=.*\d)(?=.*[/:])")
+_LABEL_TS = re.compile(r"time|date")
+
+
 def is_timestamp_field(setting: Dict[str, Any]) -> bool:
     label = setting_label(setting).lower()
-    if "time" in label or "date" in label:
+    if _LABEL_TS.search(label):
         return True
-    value = ""
     if "value" in setting and isinstance(setting.get("value"), dict):
         value = str(setting["value"].get("current_value") or "")
     else:
         value = str(setting.get("currentValue") or "")
-    return bool(
-        value
-        and (
-            any(ch in value for ch in ["/", ":"])
-            and any(ch.isdigit() for ch in value)
-        )
-    )
-
-
-def dropdown_missing_options(settings: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-    failed: List[Dict[str, Any]] = []
-    for item in settings:
-        item_type = setting_type(item)
-        if item_type not in {"dropdown_native", "dropdown_aria"}:
-            continue
-        options = item.get("options") or []
-        if len(options) == 0:
-            failed.append(
+    return bool(_TS_RE.search(value))
+
+
+@dataclass
+class SchemaIndex:
+    ids: set
+    labels: Dict[str, str]
+    types: Dict[str, str]
+    signature_map: Dict[Tuple[str, ...], str]
+    radio_orders: Dict[Tuple[str, ...], List[str]]
+    dropdown_missing: List[Dict[str, Any]]
+
+
+def _index(settings_list: List[Dict[str, Any]]) -> SchemaIndex:
+    # Single pass over the settings list building every lookup compare_schemas
+    # needs, instead of one list traversal per derived map. Label/type/id are
+    # computed inline so each record is touched exactly once.
+    ids: set = set()
+    labels: Dict[str, str] = {}
+    types: Dict[str, str] = {}
+    signature_map: Dict[Tuple[str, ...], str] = {}
+    radio_orders: Dict[Tuple[str, ...], List[str]] = {}
+    dropdown_missing: List[Dict[str, Any]] = []
+
+    for item in settings_list:
+        item_id = str(item.get("field_id") or item.get("settingKey") or "")
+        item_type = str(item.get("type") or "")
+        if "label" in item:
+            label = str(item.get("label") or "")
+        else:
+            primary = (item.get("control") or {}).get("primary_selector") or {}
+            label = str(primary.get("name") or "")
+
+        if item_type in {"dropdown_native", "dropdown_aria"} and not (item.get("options") or []):
+            dropdown_missing.append(
                 {
-                    "fieldId": setting_id(item),
-                    "label": setting_label(item),
+                    "fieldId": item_id,
+                    "label": label,
                     "reason": "dropdown has empty options[]",
                 }
             )
-    return failed
 
+        # Radio-group records need the signature for both maps; compute it at
+        # most once per record instead of once per consumer.
+        signature = None
+        if item_type == "radio_group":
+            option_labels = [
+                str(option.get("label") or option.get("value") or "") for option in (item.get("options") or [])
+            ]
+            signature = _setting_sig_tuple(item)
+            radio_orders[signature] = option_labels
 
-def radio_order_index(settings: List[Dict[str, Any]]) -> Dict[str, List[str]]:
-    index: Dict[str, List[str]] = {}
-    for item in settings:
-        if setting_type(item) != "radio_group":
+        if not item_id:
             continue
-        labels = [str(option.get("label") or option.get("value") or "") for option in (item.get("options") or [])]
-        index[setting_signature(item)] = labels
-    return index
+        ids.add(item_id)
+        labels[item_id] = label
+        types[item_id] = item_type
+        if not is_timestamp_field(item):
+            signature_map[signature if signature is not None else _setting_sig_tuple(item)] = item_id
+
+    return SchemaIndex(
+        ids=ids,
+        labels=labels,
+        types=types,
+        signature_map=signature_map,
+        radio_orders=radio_orders,
+        dropdown_missing=dropdown_missing,
+    )
 
 
 def compare_schemas(first: Dict[str, Any], second: Dict[str, Any]) -> Dict[str, Any]:
-    first_containers = {item["containerKey"]: item for item in first.get("containers", [])}
-    second_containers = {item["containerKey"]: item for item in second.get("containers", [])}
-    first_settings_list = schema_settings(first)
-    second_settings_list = schema_settings(second)
-    first_settings = {setting_id(item): item for item in first_settings_list if setting_id(item)}
-    second_settings = {setting_id(item): item for item in second_settings_list if setting_id(item)}
-
-    first_container_keys = set(first_containers.keys())
-    second_container_keys = set(second_containers.keys())
-    first_setting_keys = set(first_settings.keys())
-    second_setting_keys = set(second_settings.keys())
+    first_container_keys = {item["containerKey"] for item in first.get("containers", [])}
+    second_container_keys = {item["containerKey"] for item in second.get("containers", [])}
+    first_index = _index(schema_settings(first))
+    second_index = _index(schema_settings(second))
 
     container_added = sorted(second_container_keys - first_container_keys)
     container_removed = sorted(first_container_keys - second_container_keys)
-    setting_added = sorted(second_setting_keys - first_setting_keys)
-    setting_removed = sorted(first_setting_keys - second_setting_keys)
+    setting_added = sorted(second_index.ids - first_index.ids)
+    setting_removed = sorted(first_index.ids - second_index.ids)
 
+    # Intersections are iterated unsorted; only the emitted entries are sorted
+    # (below), so the O(N log N) passes over full key sets go away.
     changed_labels_or_types: List[Dict[str, Any]] = []
-    for key in sorted(first_setting_keys & second_setting_keys):
-        first_item = first_settings[key]
-        second_item = second_settings[key]
-        first_label = setting_label(first_item)
-        second_label = setting_label(second_item)
-        first_type = setting_type(first_item)
-        second_type = setting_type(second_item)
+    for key in first_index.ids & second_index.ids:
+        first_label = first_index.labels[key]
+        second_label = second_index.labels[key]
+        first_type = first_index.types[key]
+        second_type = second_index.types[key]
         if first_label != second_label or first_type != second_type:
             changed_labels_or_types.append(
                 {
@@ -157,44 +228,38 @@ def compare_schemas(first: Dict[str, Any], second: Dict[str, Any]) -> Dict[str,
                 }
             )
 
-    first_signature_map = {
-        setting_signature(item): setting_id(item)
-        for item in first_settings_list
-        if setting_id(item) and not is_timestamp_field(item)
-    }
-    second_signature_map = {
-        setting_signature(item): setting_id(item)
-        for item in second_settings_list
-        if setting_id(item) and not is_timestamp_field(item)
-    }
     field_id_drift = []
-    for signature in sorted(set(first_signature_map.keys()) & set(second_signature_map.keys())):
-        if first_signature_map[signature] != second_signature_map[signature]:
+    for signature in first_index.signature_map.keys() & second_index.signature_map.keys():
+        if first_index.signature_map[signature] != second_index.signature_map[signature]:
             field_id_drift.append(
                 {
-                    "signature": signature,
-                    "firstFieldId": first_signature_map[signature],
-                    "secondFieldId": second_signature_map[signature],
+                    "signature": "|".join(signature),
+                    "firstFieldId": first_index.signature_map[signature],
+                    "secondFieldId": second_index.signature_map[signature],
                 }
             )
 
-    first_radio = radio_order_index(first_settings_list)
-    second_radio = radio_order_index(second_settings_list)
     radio_ordering_changed = []
-    for signature in sorted(set(first_radio.keys()) & set(second_radio.keys())):
-        first_labels = first_radio[signature]
-        second_labels = second_radio[signature]
+    for signature in first_index.radio_orders.keys() & second_index.radio_orders.keys():
+        first_labels = first_index.radio_orders[signature]
+        second_labels = second_index.radio_orders[signature]
         if first_labels == second_labels:
             continue
-        if sorted(first_labels) == sorted(second_labels):
+        # Same multiset in a different order: O(N) Counter equality instead of
+        # two O(N log N) sorts, with a length prefilter for the cheap miss.
+        if len(first_labels) == len(second_labels) and Counter(first_labels) == Counter(second_labels):
             radio_ordering_changed.append(
                 {
-                    "signature": signature,
+                    "signature": "|".join(signature),
                     "firstOrder": first_labels,
                     "secondOrder": second_labels,
                 }
             )
 
+    changed_labels_or_types.sort(key=lambda entry: entry["settingKey"])
+    field_id_drift.sort(key=lambda entry: entry["signature"])
+    radio_ordering_changed.sort(key=lambda entry: entry["signature"])
+
     return {
         "containers": {
             "added": container_added,
@@ -206,8 +271,8 @@ def compare_schemas(first: Dict[str, Any], second: Dict[str, Any]) -> Dict[str,
             "labelOrTypeChanged": changed_labels_or_types,
         },
         "fieldIdDrift": field_id_drift,
-        "dropdownsMissingOptionsA": dropdown_missing_options(first_settings_list),
-        "dropdownsMissingOptionsB": dropdown_missing_options(second_settings_list),
+        "dropdownsMissingOptionsA": first_index.dropdown_missing,
+        "dropdownsMissingOptionsB": second_index.dropdown_missing,
         "radioOrderingChangedWithoutLabelChange": radio_ordering_changed,
     }
 
@@ -245,9 +310,13 @@ def run_crawl_and_contract(run_root: Path, run_index: int) -> Path:
 def resolve_schema_pair(args: argparse.Namespace) -> Tuple[Path, Path]:
     if args.run_crawl:
         temp_root = Path(tempfile.mkdtemp(prefix="ui-stability-"))
-        first = run_crawl_and_contract(temp_root, 1)
-        second = run_crawl_and_contract(temp_root, 2)
-        return first, second
+        # The two crawls are independent (each run dir gets its own MAP_PATH
+        # and DIST_DIR, and run_command builds an isolated env), so run them
+        # concurrently instead of paying for two full crawls back to back.
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            first_future = executor.submit(run_crawl_and_contract, temp_root, 1)
+            second_future = executor.submit(run_crawl_and_contract, temp_root, 2)
+            return first_future.result(), second_future.result()
 
     if args.schema_a and args.schema_b:
         return Path(args.schema_a), Path(args.schema_b)
@@ -262,6 +331,26 @@ def resolve_schema_pair(args: argparse.Namespace) -> Tuple[Path, Path]:
     )
 
 
+def _file_sha256(path: Path) -> str:
+    with path.open("rb") as handle:
+        return hashlib.file_digest(handle, "sha256").hexdigest()
+
+
+def identical_schema_diff(schema: Dict[str, Any]) -> Dict[str, Any]:
+    # Byte-identical captures cannot drift against each other, but the
+    # empty-dropdown check is an intra-schema property and still has to run
+    # so a no-change CI pass does not mask it.
+    index = _index(schema_settings(schema))
+    return {
+        "containers": {"added": [], "removed": []},
+        "settings": {"added": [], "removed": [], "labelOrTypeChanged": []},
+        "fieldIdDrift": [],
+        "dropdownsMissingOptionsA": index.dropdown_missing,
+        "dropdownsMissingOptionsB": index.dropdown_missing,
+        "radioOrderingChangedWithoutLabelChange": [],
+    }
+
+
 def main() -> int:
     parser = argparse.ArgumentParser(
         description="Compare two ui_schema captures and fail on field-id drift, empty dropdown options, or unstable radio option ordering."
@@ -286,9 +375,16 @@ def main() -> int:
     args = parser.parse_args()
 
     first_path, second_path = resolve_schema_pair(args)
-    first_schema = read_schema(first_path)
-    second_schema = read_schema(second_path)
-    diff = compare_schemas(first_schema, second_schema)
+    # Streaming SHA-256 of both files is far cheaper than parsing them, so the
+    # common nothing-changed CI path skips the full compare entirely.
+    try:
+        identical = _file_sha256(first_path) == _file_sha256(second_path)
+    except OSError:
+        identical = False
+    if identical:
+        diff = identical_schema_diff(read_schema(first_path))
+    else:
+        diff = compare_schemas(read_schema(first_path), read_schema(second_path))
     drift = has_drift(diff)
 
     report = {
@@ -302,9 +398,14 @@ def main() -> int:
 
     report_path = Path(args.report)
     report_path.parent.mkdir(parents=True, exist_ok=True)
-    with report_path.open("w", encoding="utf-8") as handle:
-        json.dump(report, handle, indent=2)
-        handle.write("\n")
+    try:
+        import orjson
+
+        report_path.write_bytes(orjson.dumps(report, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE))
+    except ImportError:
+        with report_path.open("w", encoding="utf-8") as handle:
+            json.dump(report, handle, indent=2)
+            handle.write("\n")
 
     print(f"Wrote {report_path}")
     if drift and not args.ui_changed: